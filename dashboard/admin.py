@@ -1,4 +1,8 @@
+from datetime import datetime, timedelta
+
 from django.contrib import admin
+from django.db import connection
+from django.utils import timezone
 from .models import (
     UserProfile,
     AIEthicsPolicy,
@@ -9,19 +13,116 @@ from .models import (
 )
 
 
+class RangeBasedDateHierarchyMixin:
+    """
+    Constrain date hierarchy drilldowns with half-open timestamp ranges.
+
+    The default drilldown filters with EXTRACT(year/month/day) comparisons
+    that the database cannot answer from an index on the date field. Adding
+    an equivalent [start, end) range lets the planner use an index range
+    scan, while the original parameters keep the drilldown navigation intact.
+    """
+
+    def changelist_view(self, request, extra_context=None):
+        field = self.date_hierarchy
+        if field and f'{field}__year' in request.GET:
+            try:
+                year = int(request.GET[f'{field}__year'])
+                month = int(request.GET.get(f'{field}__month', 0))
+                day = int(request.GET.get(f'{field}__day', 0))
+                lower = datetime(year, month or 1, day or 1)
+                if day:
+                    upper = lower + timedelta(days=1)
+                elif month:
+                    upper = datetime(year + (month == 12), month % 12 + 1, 1)
+                else:
+                    upper = datetime(year + 1, 1, 1)
+            except ValueError:
+                # Let the admin report the malformed parameters itself.
+                pass
+            else:
+                params = request.GET.copy()
+                params[f'{field}__gte'] = timezone.make_aware(lower).isoformat()
+                params[f'{field}__lt'] = timezone.make_aware(upper).isoformat()
+                request.GET = params
+        return super().changelist_view(request, extra_context=extra_context)
+
+
+class ChangelistOnlyFieldsMixin:
+    """
+    Load only the columns the changelist actually renders.
+
+    The admin fetches every model field for each changelist row, including
+    TextField/JSONField blobs that list_display never shows. Restricting the
+    changelist queryset to the rendered columns keeps row payloads small.
+    The projection is applied only on the changelist URL, so change forms
+    still load full rows. Relations named in list_select_related must have
+    at least one field listed here, since a select_related model cannot be
+    deferred.
+    """
+    changelist_only_fields = ()
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if (
+            self.changelist_only_fields
+            and request.resolver_match
+            and request.resolver_match.url_name.endswith('_changelist')
+        ):
+            # select_related() with no arguments means "follow every FK",
+            # so only join when the admin names relations explicitly
+            if self.list_select_related:
+                queryset = queryset.select_related(*self.list_select_related)
+            queryset = queryset.only(*self.changelist_only_fields)
+        return queryset
+
+
+class FullTextSearchMixin:
+    """
+    Full-text search over large text columns when running on Postgres.
+
+    search_fields only covers short, prefix-indexable columns; this mixin
+    restores search over description-style TextFields via Postgres full-text
+    search, which stays sublinear where LIKE '%term%' would scan the table.
+    On other backends (the project develops on SQLite) searches fall back to
+    the regular search_fields behaviour. A stored SearchVectorField with a
+    GIN index would be faster still, but needs Postgres-only DDL that this
+    project's migrations cannot carry.
+    """
+    full_text_fields = ()
+
+    def get_search_results(self, request, queryset, search_term):
+        if search_term and self.full_text_fields and connection.vendor == 'postgresql':
+            from django.contrib.postgres.search import SearchQuery, SearchVector
+            queryset = queryset.annotate(
+                search=SearchVector(*self.full_text_fields)
+            ).filter(search=SearchQuery(search_term))
+            return queryset, False
+        return super().get_search_results(request, queryset, search_term)
+
+
 @admin.register(UserProfile)
-class UserProfileAdmin(admin.ModelAdmin):
+class UserProfileAdmin(ChangelistOnlyFieldsMixin, admin.ModelAdmin):
     list_display = ['user', 'student_id', 'department', 'data_collection_consent', 'created_at']
     list_filter = ['data_collection_consent', 'allow_analytics', 'created_at']
-    search_fields = ['user__username', 'user__email', 'student_id']
+    list_select_related = ('user',)
+    changelist_only_fields = (
+        'user__username', 'student_id', 'department',
+        'data_collection_consent', 'created_at',
+    )
+    search_fields = ['^user__username', '^user__email', '^student_id']
     readonly_fields = ['created_at', 'updated_at']
 
 
 @admin.register(AIEthicsPolicy)
-class AIEthicsPolicyAdmin(admin.ModelAdmin):
+class AIEthicsPolicyAdmin(ChangelistOnlyFieldsMixin, admin.ModelAdmin):
     list_display = ['title', 'version', 'status', 'effective_from', 'effective_until', 'is_active']
     list_filter = ['status', 'effective_from']
-    search_fields = ['title', 'description']
+    search_fields = ['^title']
+    changelist_only_fields = (
+        'title', 'version', 'status', 'effective_from', 'effective_until',
+        'is_currently_active',
+    )
     readonly_fields = ['created_at', 'updated_at']
     fieldsets = (
         ('Basic Information', {
@@ -41,10 +142,22 @@ class AIEthicsPolicyAdmin(admin.ModelAdmin):
 
 
 @admin.register(AIUsageLog)
-class AIUsageLogAdmin(admin.ModelAdmin):
+class AIUsageLogAdmin(RangeBasedDateHierarchyMixin, FullTextSearchMixin,
+                      ChangelistOnlyFieldsMixin, admin.ModelAdmin):
     list_display = ['user', 'ai_tool', 'usage_type', 'is_compliant', 'timestamp']
     list_filter = ['ai_tool', 'usage_type', 'is_compliant', 'timestamp']
-    search_fields = ['user__username', 'description', 'course_code']
+    # The changelist only renders the user; joining policy would force its
+    # columns to load alongside the projected fields below.
+    list_select_related = ('user',)
+    changelist_only_fields = (
+        'user__username', 'ai_tool', 'usage_type', 'is_compliant', 'timestamp',
+    )
+    list_per_page = 50
+    show_full_result_count = False
+    # Prefix-anchored so searches hit btree indexes instead of scanning the
+    # description TextField with LIKE '%term%'.
+    search_fields = ['^user__username', '^course_code']
+    full_text_fields = ('description',)
     readonly_fields = ['timestamp', 'is_compliant', 'compliance_notes']
     date_hierarchy = 'timestamp'
     
@@ -69,27 +182,44 @@ class AIUsageLogAdmin(admin.ModelAdmin):
 
 
 @admin.register(ComplianceStatus)
-class ComplianceStatusAdmin(admin.ModelAdmin):
+class ComplianceStatusAdmin(ChangelistOnlyFieldsMixin, admin.ModelAdmin):
     list_display = ['user', 'compliance_level', 'compliance_score', 'period_start', 'period_end', 'calculated_at']
     list_filter = ['compliance_level', 'calculated_at']
-    search_fields = ['user__username']
+    list_select_related = ('user',)
+    changelist_only_fields = (
+        'user__username', 'compliance_level', 'compliance_score',
+        'period_start', 'period_end', 'calculated_at',
+    )
+    search_fields = ['^user__username']
     readonly_fields = ['calculated_at']
 
 
 @admin.register(UserInsight)
-class UserInsightAdmin(admin.ModelAdmin):
+class UserInsightAdmin(ChangelistOnlyFieldsMixin, admin.ModelAdmin):
     list_display = ['user', 'insight_type', 'title', 'priority', 'is_read', 'generated_at']
     list_filter = ['insight_type', 'priority', 'is_read', 'is_dismissed', 'generated_at']
-    search_fields = ['user__username', 'title', 'message']
+    list_select_related = ('user',)
+    changelist_only_fields = (
+        'user__username', 'insight_type', 'title', 'priority', 'is_read',
+        'generated_at',
+    )
+    list_per_page = 50
+    show_full_result_count = False
+    search_fields = ['^user__username', '^title']
     readonly_fields = ['generated_at']
-    filter_horizontal = ['related_usage_logs']
+    autocomplete_fields = ['related_usage_logs']
 
 
 @admin.register(UserFeedback)
-class UserFeedbackAdmin(admin.ModelAdmin):
+class UserFeedbackAdmin(FullTextSearchMixin, ChangelistOnlyFieldsMixin, admin.ModelAdmin):
     list_display = ['user', 'feedback_type', 'title', 'status', 'submitted_at']
     list_filter = ['feedback_type', 'status', 'submitted_at']
-    search_fields = ['user__username', 'title', 'description']
+    list_select_related = ('user',)
+    changelist_only_fields = (
+        'user__username', 'feedback_type', 'title', 'status', 'submitted_at',
+    )
+    search_fields = ['^user__username', '^title']
+    full_text_fields = ('title', 'description')
     readonly_fields = ['submitted_at', 'updated_at']
     
     fieldsets = (
@@ -0,0 +1,88 @@
+"""
+Generate usage insights in batch.
+
+Replaces the per-insert signal work: intended to run periodically (cron,
+every few minutes is fine) so the write path stays free of insight queries
+while warnings and milestone achievements catch up in bulk.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db.models import F
+from django.utils import timezone
+
+from dashboard.models import MILESTONES, UsageCounter, UserInsight, UserProfile
+
+
+class Command(BaseCommand):
+    help = 'Generate high-usage warnings and milestone achievements in batch.'
+
+    def handle(self, *args, **options):
+        warnings = self.generate_warnings()
+        achievements = self.generate_milestones()
+        self.stdout.write(
+            f'Created {warnings} warning and {achievements} achievement insights.'
+        )
+
+    def generate_warnings(self):
+        """Create at most one high-usage warning per user per day."""
+        today = timezone.localdate()
+        heavy_users = dict(
+            UsageCounter.objects.filter(
+                period='daily', period_start=today, count__gte=50
+            ).values_list('user_id', 'count')
+        )
+        if not heavy_users:
+            return 0
+
+        already_warned = set(
+            UserInsight.objects.filter(
+                user_id__in=heavy_users,
+                insight_type='warning',
+                generated_at__date=today,
+            ).values_list('user_id', flat=True)
+        )
+
+        insights = [
+            UserInsight(
+                user_id=user_id,
+                insight_type='warning',
+                title='High AI Usage Today',
+                message=f'You have logged {count} AI interactions today. Consider taking breaks and reflecting on your learning process.',
+                priority='high',
+            )
+            for user_id, count in heavy_users.items()
+            if user_id not in already_warned
+        ]
+        UserInsight.objects.bulk_create(insights, batch_size=1000)
+        return len(insights)
+
+    def generate_milestones(self):
+        """Award achievements for every milestone crossed since the last run."""
+        profiles = UserProfile.objects.filter(
+            total_ai_usage__gte=min(MILESTONES),
+            total_ai_usage__gt=F('last_milestone'),
+        )
+
+        insights = []
+        reached = []
+        for profile in profiles.iterator():
+            crossed = [
+                milestone for milestone in sorted(MILESTONES)
+                if profile.last_milestone < milestone <= profile.total_ai_usage
+            ]
+            if not crossed:
+                continue
+            for milestone in crossed:
+                insights.append(UserInsight(
+                    user_id=profile.user_id,
+                    insight_type='achievement',
+                    title=f'Milestone: {milestone} AI Interactions!',
+                    message=f'Congratulations! You have logged {milestone} AI interactions. Keep learning responsibly!',
+                    priority='medium',
+                ))
+            profile.last_milestone = crossed[-1]
+            reached.append(profile)
+
+        UserInsight.objects.bulk_create(insights, batch_size=1000)
+        UserProfile.objects.bulk_update(reached, ['last_milestone'], batch_size=1000)
+        return len(insights)
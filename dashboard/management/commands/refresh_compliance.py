@@ -0,0 +1,39 @@
+"""
+Recalculate compliance scores for all compliance status rows in bulk.
+
+Intended for a nightly cron run. Scores are computed in Python from the
+stored usage counts and written back with bulk_update, batching many rows
+per statement instead of issuing one UPDATE per row via calculate_score().
+"""
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from dashboard.models import ComplianceStatus
+
+
+class Command(BaseCommand):
+    help = 'Recalculate compliance scores for all compliance status rows.'
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        changed = []
+
+        statuses = ComplianceStatus.objects.only(
+            'id', 'compliance_score', 'compliance_level',
+            'total_usage_count', 'compliant_usage_count',
+        )
+        for status in statuses.iterator(chunk_size=2000):
+            score, level = status._compute_score()
+            if (score, level) != (status.compliance_score, status.compliance_level):
+                status.compliance_score = score
+                status.compliance_level = level
+                status.calculated_at = now
+                changed.append(status)
+
+        ComplianceStatus.objects.bulk_update(
+            changed,
+            ['compliance_score', 'compliance_level', 'calculated_at'],
+            batch_size=1000,
+        )
+        self.stdout.write(f'Recalculated {len(changed)} compliance rows.')
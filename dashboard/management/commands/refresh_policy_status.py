@@ -0,0 +1,34 @@
+"""
+Refresh the denormalized is_currently_active flag on AI ethics policies.
+
+Intended to run daily (e.g. from cron) so policies whose effective window
+opens or closes with the passage of time get their flag updated without
+anyone saving the row.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+
+from dashboard.models import AIEthicsPolicy
+
+
+class Command(BaseCommand):
+    help = 'Refresh the denormalized is_currently_active flag on AI ethics policies.'
+
+    def handle(self, *args, **options):
+        today = timezone.now().date()
+        active = Q(status='active', effective_from__lte=today) & (
+            Q(effective_until__gte=today) | Q(effective_until__isnull=True)
+        )
+
+        activated = AIEthicsPolicy.objects.filter(
+            active, is_currently_active=False
+        ).update(is_currently_active=True)
+        deactivated = AIEthicsPolicy.objects.filter(
+            ~active, is_currently_active=True
+        ).update(is_currently_active=False)
+
+        self.stdout.write(
+            f'Activated {activated} and deactivated {deactivated} policies.'
+        )
@@ -0,0 +1,37 @@
+from datetime import timedelta
+
+from django.db import migrations
+
+
+def backfill_counters(apps, schema_editor):
+    """Rebuild daily and weekly usage counters from the existing usage logs."""
+    AIUsageLog = apps.get_model('dashboard', 'AIUsageLog')
+    UsageCounter = apps.get_model('dashboard', 'UsageCounter')
+
+    counters = {}
+    for user_id, timestamp in AIUsageLog.objects.values_list('user_id', 'timestamp').iterator():
+        day = timestamp.date()
+        week_start = day - timedelta(days=day.weekday())
+        for period, start in (('daily', day), ('weekly', week_start)):
+            key = (user_id, period, start)
+            counters[key] = counters.get(key, 0) + 1
+
+    UsageCounter.objects.bulk_create([
+        UsageCounter(user_id=user_id, period=period, period_start=start, count=count)
+        for (user_id, period, start), count in counters.items()
+    ], batch_size=1000)
+
+
+def clear_counters(apps, schema_editor):
+    apps.get_model('dashboard', 'UsageCounter').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0002_usagecounter'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_counters, clear_counters),
+    ]
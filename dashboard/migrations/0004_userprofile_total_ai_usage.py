@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-08-30 20:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0003_backfill_usage_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='total_ai_usage',
+            field=models.IntegerField(default=0),
+        ),
+    ]
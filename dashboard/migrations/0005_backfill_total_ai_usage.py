@@ -0,0 +1,31 @@
+from django.db import migrations
+from django.db.models import Count
+
+
+def backfill_totals(apps, schema_editor):
+    """Seed the cached lifetime usage totals from the existing usage logs."""
+    AIUsageLog = apps.get_model('dashboard', 'AIUsageLog')
+    UserProfile = apps.get_model('dashboard', 'UserProfile')
+
+    totals = (
+        AIUsageLog.objects.values('user_id')
+        .annotate(total=Count('id'))
+        .values_list('user_id', 'total')
+    )
+    for user_id, total in totals:
+        UserProfile.objects.filter(user_id=user_id).update(total_ai_usage=total)
+
+
+def clear_totals(apps, schema_editor):
+    apps.get_model('dashboard', 'UserProfile').objects.update(total_ai_usage=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0004_userprofile_total_ai_usage'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_totals, clear_totals),
+    ]
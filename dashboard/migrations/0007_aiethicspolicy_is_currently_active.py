@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-08-30 20:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0005_backfill_total_ai_usage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aiethicspolicy',
+            name='is_currently_active',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+    ]
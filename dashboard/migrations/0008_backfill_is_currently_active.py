@@ -0,0 +1,30 @@
+from django.db import migrations
+from django.db.models import Q
+from django.utils import timezone
+
+
+def backfill_active_flags(apps, schema_editor):
+    """Compute the denormalized active flag for existing policies."""
+    AIEthicsPolicy = apps.get_model('dashboard', 'AIEthicsPolicy')
+    today = timezone.now().date()
+    active = Q(status='active', effective_from__lte=today) & (
+        Q(effective_until__gte=today) | Q(effective_until__isnull=True)
+    )
+    AIEthicsPolicy.objects.filter(active).update(is_currently_active=True)
+
+
+def clear_active_flags(apps, schema_editor):
+    apps.get_model('dashboard', 'AIEthicsPolicy').objects.update(
+        is_currently_active=False
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0007_aiethicspolicy_is_currently_active'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_active_flags, clear_active_flags),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-08-30 20:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0008_backfill_is_currently_active'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='last_milestone',
+            field=models.IntegerField(default=0),
+        ),
+    ]
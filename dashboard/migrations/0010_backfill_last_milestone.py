@@ -0,0 +1,29 @@
+from django.db import migrations
+
+# Kept in step with dashboard.models.MILESTONES; hardcoded so the migration
+# stays stable if the live set changes later.
+MILESTONES = (10, 50, 100, 250, 500, 1000)
+
+
+def backfill_last_milestone(apps, schema_editor):
+    """Mark already-crossed milestones as awarded so the batch job doesn't re-award them."""
+    UserProfile = apps.get_model('dashboard', 'UserProfile')
+    for milestone in MILESTONES:
+        UserProfile.objects.filter(total_ai_usage__gte=milestone).update(
+            last_milestone=milestone
+        )
+
+
+def clear_last_milestone(apps, schema_editor):
+    apps.get_model('dashboard', 'UserProfile').objects.update(last_milestone=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0009_userprofile_last_milestone'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_last_milestone, clear_last_milestone),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-08-30 20:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0010_backfill_last_milestone'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='aiusagelog',
+            index=models.Index(fields=['user', 'is_compliant'], name='aiusage_user_comp_idx'),
+        ),
+    ]
@@ -5,13 +5,27 @@ This module defines the data models for tracking AI usage, compliance policies,
 user insights, and feedback. Designed with GDPR compliance in mind.
 """
 
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, F, Q
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 from datetime import timedelta
+from functools import lru_cache
 import json
 
+# Lifetime usage totals that earn an achievement insight.
+MILESTONES = frozenset((10, 50, 100, 250, 500, 1000))
+
+# Cache key for the currently active policy (see views._get_active_policy);
+# invalidated by the policy signal handlers.
+ACTIVE_POLICY_CACHE_KEY = 'dashboard:active_policy'
+
+
+def chart_cache_key(user_id):
+    """Cache key for a user's serialized dashboard chart data."""
+    return f'dash_charts_{user_id}'
+
 
 class UserProfile(models.Model):
     """
@@ -32,7 +46,12 @@ class UserProfile(models.Model):
     # User preferences
     email_notifications = models.BooleanField(default=True)
     weekly_summary = models.BooleanField(default=True)
-    
+
+    # Cached lifetime usage total (maintained on AIUsageLog inserts) and the
+    # last milestone already awarded by the generate_insights command
+    total_ai_usage = models.IntegerField(default=0)
+    last_milestone = models.IntegerField(default=0)
+
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -47,12 +66,14 @@ class UserProfile(models.Model):
         return f"{self.user.username} - Profile"
     
     def get_usage_summary(self):
-        """Get summary of AI usage for this user."""
-        total_usage = self.user.ai_usage_logs.count()
-        this_week = self.user.ai_usage_logs.filter(
-            timestamp__gte=timezone.now() - timedelta(days=7)
-        ).count()
-        return {'total': total_usage, 'this_week': this_week}
+        """Get summary of AI usage for this user in one aggregate query."""
+        return self.user.ai_usage_logs.aggregate(
+            total=Count('id'),
+            this_week=Count(
+                'id',
+                filter=Q(timestamp__gte=timezone.now() - timedelta(days=7))
+            ),
+        )
 
 
 class AIEthicsPolicy(models.Model):
@@ -71,7 +92,11 @@ class AIEthicsPolicy(models.Model):
     description = models.TextField()
     version = models.CharField(max_length=20, default='1.0')
     status = models.CharField(max_length=20, choices=POLICY_STATUS_CHOICES, default='draft')
-    
+
+    # Denormalized active flag (status + effective window). Refreshed on save
+    # and by the refresh_policy_status management command as dates roll over.
+    is_currently_active = models.BooleanField(default=False, db_index=True)
+
     # Policy rules (stored as JSON for flexibility)
     rules = models.JSONField(default=dict, help_text='Policy rules in JSON format')
     
@@ -103,8 +128,13 @@ class AIEthicsPolicy(models.Model):
     def __str__(self):
         return f"{self.title} (v{self.version})"
     
-    def is_active(self):
-        """Check if policy is currently active."""
+    def save(self, *args, **kwargs):
+        """Recompute the denormalized active flag before saving."""
+        self.is_currently_active = self._compute_is_active()
+        super().save(*args, **kwargs)
+
+    def _compute_is_active(self):
+        """Compute the active flag from status and the effective window."""
         today = timezone.now().date()
         if self.status != 'active':
             return False
@@ -114,6 +144,103 @@ class AIEthicsPolicy(models.Model):
             return False
         return True
 
+    def is_active(self):
+        """Check if policy is currently active (reads the stored flag)."""
+        return self.is_currently_active
+
+
+@lru_cache(maxsize=32)
+def _policy_snapshot(policy_id, day):
+    """
+    Load a trimmed policy row for compliance checks, cached per (policy, day).
+
+    Bursts of usage logging against the same active policy reuse one fetch
+    instead of hydrating the policy FK on every insert. Keyed on the current
+    date so a cached active flag cannot outlive the day it was computed for;
+    policy saves and deletes clear the cache via signal handlers.
+    """
+    return AIEthicsPolicy.objects.only(
+        'id', 'status', 'is_currently_active', 'effective_from',
+        'effective_until', 'max_daily_usage', 'max_weekly_usage',
+    ).get(pk=policy_id)
+
+
+class UsageCounter(models.Model):
+    """
+    Cached per-user usage counters for fast compliance checks.
+
+    Maintained on every AIUsageLog insert so that compliance checks are a
+    single indexed row fetch instead of a COUNT over the whole usage log table.
+    """
+    PERIOD_CHOICES = [
+        ('daily', 'Daily'),
+        ('weekly', 'Weekly'),
+    ]
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='usage_counters')
+    period = models.CharField(max_length=10, choices=PERIOD_CHOICES)
+    period_start = models.DateField(help_text='First day of the counted period')
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'usage_counter'
+        verbose_name = 'Usage Counter'
+        verbose_name_plural = 'Usage Counters'
+        unique_together = ['user', 'period', 'period_start']
+
+    def __str__(self):
+        return f"{self.user.username} - {self.period} {self.period_start} ({self.count})"
+
+    @staticmethod
+    def week_start(day):
+        """Return the Monday of the ISO week containing the given date."""
+        return day - timedelta(days=day.weekday())
+
+    @classmethod
+    def _periods(cls, day):
+        return (('daily', day), ('weekly', cls.week_start(day)))
+
+    @classmethod
+    def add(cls, user, amount):
+        """
+        Atomically add `amount` to today's daily and this week's weekly counters.
+
+        Returns a dict with the new 'daily' and 'weekly' counts, including
+        the amount just applied.
+        """
+        today = timezone.localdate()
+        counts = {}
+        for period, start in cls._periods(today):
+            counter, created = cls.objects.get_or_create(
+                user=user,
+                period=period,
+                period_start=start,
+                defaults={'count': amount},
+            )
+            if not created:
+                cls.objects.filter(pk=counter.pk).update(count=F('count') + amount)
+                counter.refresh_from_db(fields=['count'])
+            counts[period] = counter.count
+        return counts
+
+    @classmethod
+    def increment(cls, user):
+        """Atomically bump today's daily and this week's weekly counters by one."""
+        return cls.add(user, 1)
+
+    @classmethod
+    def current_counts(cls, user):
+        """Return the current 'daily' and 'weekly' counts for a user."""
+        today = timezone.localdate()
+        counts = {}
+        for period, start in cls._periods(today):
+            counts[period] = (
+                cls.objects.filter(user=user, period=period, period_start=start)
+                .values_list('count', flat=True)
+                .first()
+            ) or 0
+        return counts
+
 
 class AIUsageLog(models.Model):
     """
@@ -185,6 +312,7 @@ class AIUsageLog(models.Model):
         ordering = ['-timestamp']
         indexes = [
             models.Index(fields=['user', '-timestamp']),
+            models.Index(fields=['user', 'is_compliant'], name='aiusage_user_comp_idx'),
             models.Index(fields=['timestamp']),
             models.Index(fields=['ai_tool']),
         ]
@@ -193,41 +321,83 @@ class AIUsageLog(models.Model):
         return f"{self.user.username} - {self.ai_tool} - {self.timestamp.strftime('%Y-%m-%d %H:%M')}"
     
     def save(self, *args, **kwargs):
-        """Check compliance before saving."""
-        if self.policy:
-            self.check_compliance()
-        super().save(*args, **kwargs)
-    
-    def check_compliance(self):
-        """Check if this usage complies with the policy."""
-        if not self.policy or not self.policy.is_active():
+        """Update usage counters on insert; compliance is evaluated after commit."""
+        if self._state.adding:
+            from . import tasks
+            with transaction.atomic():
+                counts = UsageCounter.increment(self.user)
+                super().save(*args, **kwargs)
+                if self.policy_id:
+                    transaction.on_commit(
+                        lambda pk=self.pk, c=counts: tasks.check_compliance(pk, c)
+                    )
+        else:
+            super().save(*args, **kwargs)
+
+    @classmethod
+    def bulk_log(cls, entries, batch_size=1000):
+        """
+        Compliance-check and insert many usage logs in a handful of queries.
+
+        bulk_create() bypasses save() and post_save signals, so compliance is
+        stamped in Python here against the cached usage counters, and the
+        counters and lifetime totals are advanced by the number of logs
+        inserted per user.
+        """
+        entries = list(entries)
+        if not entries:
+            return []
+
+        by_user = {}
+        for entry in entries:
+            by_user.setdefault(entry.user, []).append(entry)
+
+        with transaction.atomic():
+            for user, user_entries in by_user.items():
+                counts = UsageCounter.current_counts(user)
+                daily, weekly = counts['daily'], counts['weekly']
+                for entry in user_entries:
+                    daily += 1
+                    weekly += 1
+                    if entry.policy:
+                        entry.check_compliance({'daily': daily, 'weekly': weekly})
+                UsageCounter.add(user, len(user_entries))
+                UserProfile.objects.filter(user=user).update(
+                    total_ai_usage=F('total_ai_usage') + len(user_entries)
+                )
+            return cls.objects.bulk_create(entries, batch_size=batch_size)
+
+    def check_compliance(self, counts=None):
+        """
+        Check if this usage complies with the policy.
+
+        Reads the cached UsageCounter values (including this log) instead of
+        counting rows in the usage log table.
+        """
+        if not self.policy_id:
+            self.is_compliant = True
+            return
+
+        policy = _policy_snapshot(self.policy_id, timezone.localdate())
+        if not policy.is_active():
             self.is_compliant = True
             return
-        
+
+        if counts is None:
+            counts = UsageCounter.current_counts(self.user)
+
         # Check daily usage limit
-        today_start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        daily_count = AIUsageLog.objects.filter(
-            user=self.user,
-            timestamp__gte=today_start
-        ).count()
-        
-        if daily_count >= self.policy.max_daily_usage:
+        if counts['daily'] > policy.max_daily_usage:
             self.is_compliant = False
-            self.compliance_notes = f"Exceeded daily usage limit of {self.policy.max_daily_usage}"
+            self.compliance_notes = f"Exceeded daily usage limit of {policy.max_daily_usage}"
             return
-        
+
         # Check weekly usage limit
-        week_start = timezone.now() - timedelta(days=7)
-        weekly_count = AIUsageLog.objects.filter(
-            user=self.user,
-            timestamp__gte=week_start
-        ).count()
-        
-        if weekly_count >= self.policy.max_weekly_usage:
+        if counts['weekly'] > policy.max_weekly_usage:
             self.is_compliant = False
-            self.compliance_notes = f"Exceeded weekly usage limit of {self.policy.max_weekly_usage}"
+            self.compliance_notes = f"Exceeded weekly usage limit of {policy.max_weekly_usage}"
             return
-        
+
         self.is_compliant = True
         self.compliance_notes = "Usage within policy limits"
 
@@ -282,24 +452,39 @@ class ComplianceStatus(models.Model):
     
     def calculate_score(self):
         """Calculate compliance score based on usage patterns."""
+        self.compliance_score, self.compliance_level = self._compute_score()
+
+        if self.pk:
+            # Send only the recalculated columns instead of a full-row save;
+            # calculated_at is auto_now so it must be set explicitly here.
+            ComplianceStatus.objects.filter(pk=self.pk).update(
+                compliance_score=self.compliance_score,
+                compliance_level=self.compliance_level,
+                calculated_at=timezone.now(),
+            )
+        else:
+            self.save()
+
+    def _compute_score(self):
+        """Compute (score, level) from the stored usage counts."""
         if self.total_usage_count == 0:
-            self.compliance_score = 100
+            score = 100
         else:
-            self.compliance_score = int(
+            score = int(
                 (self.compliant_usage_count / self.total_usage_count) * 100
             )
-        
+
         # Determine compliance level
-        if self.compliance_score >= 90:
-            self.compliance_level = 'excellent'
-        elif self.compliance_score >= 75:
-            self.compliance_level = 'good'
-        elif self.compliance_score >= 50:
-            self.compliance_level = 'warning'
+        if score >= 90:
+            level = 'excellent'
+        elif score >= 75:
+            level = 'good'
+        elif score >= 50:
+            level = 'warning'
         else:
-            self.compliance_level = 'violation'
-        
-        self.save()
+            level = 'violation'
+
+        return score, level
 
 
 class UserInsight(models.Model):
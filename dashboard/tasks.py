@@ -0,0 +1,27 @@
+"""
+Deferred tasks for the dashboard app.
+
+No task queue is configured for this project, so these run in-process via
+transaction.on_commit once the surrounding transaction has committed. They
+are written as plain functions taking primary keys, so they can be handed
+to a worker (Celery/RQ) later without change.
+"""
+
+from .models import AIUsageLog
+
+
+def check_compliance(log_id, counts=None):
+    """
+    Evaluate compliance for a saved usage log and persist the result.
+
+    Persists with a queryset update() so the write sends only the two
+    compliance columns and does not re-trigger save() or post_save signals.
+    """
+    log = AIUsageLog.objects.filter(pk=log_id).first()
+    if log is None:
+        return
+    log.check_compliance(counts)
+    AIUsageLog.objects.filter(pk=log_id).update(
+        is_compliant=log.is_compliant,
+        compliance_notes=log.compliance_notes,
+    )
@@ -9,14 +9,23 @@ from django.contrib.auth import login, authenticate, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
 from django.contrib import messages
+from django.core.cache import cache
 from django.db.models import Count, Sum, Q
+from django.db.models.functions import TruncDate
 from django.utils import timezone
-from django.http import JsonResponse
-from django.core.paginator import Paginator
-from datetime import timedelta, datetime
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils.dateparse import parse_date, parse_datetime
+from datetime import timedelta, datetime, time
 import json
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
 from .models import (
+    ACTIVE_POLICY_CACHE_KEY,
+    chart_cache_key,
     UserProfile,
     AIUsageLog,
     AIEthicsPolicy,
@@ -32,6 +41,43 @@ from .forms import (
 )
 
 
+def _json_dumps(value):
+    """
+    Serialize a chart or export payload to a JSON string.
+
+    Uses orjson (native code, handles date/datetime directly) when it is
+    installed, falling back to the stdlib encoder with str() for the types
+    orjson would have covered.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=str).decode()
+    return json.dumps(value, default=str)
+
+
+def _get_active_policy():
+    """
+    Return the currently active policy, cached for 60 seconds.
+
+    The active policy only changes when an admin edits policy rows, so the
+    whole dashboard shares one lookup per minute instead of re-running the
+    four-predicate query on every request. Policy saves and deletes clear
+    the key immediately via signal handlers. The value is wrapped in a
+    tuple so "no active policy" is also cached.
+    """
+    cached = cache.get(ACTIVE_POLICY_CACHE_KEY)
+    if cached is None:
+        today = timezone.now().date()
+        policy = AIEthicsPolicy.objects.filter(
+            status='active',
+            effective_from__lte=today
+        ).filter(
+            Q(effective_until__gte=today) | Q(effective_until__isnull=True)
+        ).first()
+        cache.set(ACTIVE_POLICY_CACHE_KEY, (policy,), 60)
+        return policy
+    return cached[0]
+
+
 def login_view(request):
     """
     Handle user login.
@@ -111,40 +157,40 @@ def dashboard_view(request):
     user = request.user
     
     # Get active policy
-    active_policy = AIEthicsPolicy.objects.filter(
-        status='active',
-        effective_from__lte=timezone.now().date()
-    ).filter(
-        Q(effective_until__gte=timezone.now().date()) | Q(effective_until__isnull=True)
-    ).first()
-    
-    # Get usage statistics
-    total_usage = AIUsageLog.objects.filter(user=user).count()
-    
-    # Today's usage
-    today_start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    today_usage = AIUsageLog.objects.filter(user=user, timestamp__gte=today_start).count()
-    
-    # This week's usage
-    week_start = timezone.now() - timedelta(days=7)
-    week_usage = AIUsageLog.objects.filter(user=user, timestamp__gte=week_start).count()
-    
-    # This month's usage
-    month_start = timezone.now() - timedelta(days=30)
-    month_usage = AIUsageLog.objects.filter(user=user, timestamp__gte=month_start).count()
-    
+    active_policy = _get_active_policy()
+
+    # Take one clock reading so every window edge below is consistent even
+    # if the request straddles midnight
+    now = timezone.now()
+    today = timezone.localdate(now)
+
+    # Get usage statistics (total/today/week/month plus the recent
+    # compliance split) in a single aggregate query
+    today_start = timezone.make_aware(datetime.combine(today, time.min))
+    week_start = now - timedelta(days=7)
+    month_start = now - timedelta(days=30)
+    stats = AIUsageLog.objects.filter(user=user).aggregate(
+        total=Count('id'),
+        today=Count('id', filter=Q(timestamp__gte=today_start)),
+        week=Count('id', filter=Q(timestamp__gte=week_start)),
+        month=Count('id', filter=Q(timestamp__gte=month_start)),
+        compliant_week=Count(
+            'id', filter=Q(timestamp__gte=week_start, is_compliant=True)
+        ),
+    )
+    total_usage = stats['total']
+    today_usage = stats['today']
+    week_usage = stats['week']
+    month_usage = stats['month']
+
     # Compliance status
     compliance_status = None
     compliance_percentage = 100
     if active_policy:
-        # Calculate compliance
-        recent_logs = AIUsageLog.objects.filter(
-            user=user,
-            timestamp__gte=week_start
-        )
-        total_recent = recent_logs.count()
-        compliant_recent = recent_logs.filter(is_compliant=True).count()
-        
+        # Calculate compliance over the last week
+        total_recent = stats['week']
+        compliant_recent = stats['compliant_week']
+
         if total_recent > 0:
             compliance_percentage = int((compliant_recent / total_recent) * 100)
         
@@ -164,8 +210,11 @@ def dashboard_view(request):
             'policy': active_policy
         }
     
-    # Recent activity (last 10 logs)
-    recent_logs = AIUsageLog.objects.filter(user=user).order_by('-timestamp')[:10]
+    # Recent activity (last 10 logs); join the policy so rendering it never
+    # costs one query per row
+    recent_logs = AIUsageLog.objects.filter(user=user).select_related(
+        'policy'
+    ).order_by('-timestamp')[:10]
     
     # Unread insights
     unread_insights = UserInsight.objects.filter(
@@ -174,32 +223,44 @@ def dashboard_view(request):
         is_dismissed=False
     ).order_by('-priority', '-generated_at')[:5]
     
-    # Usage by tool (pie chart data)
-    usage_by_tool = AIUsageLog.objects.filter(user=user).values('ai_tool').annotate(
-        count=Count('id')
-    ).order_by('-count')
-    
-    # Usage by type (bar chart data)
-    usage_by_type = AIUsageLog.objects.filter(user=user).values('usage_type').annotate(
-        count=Count('id')
-    ).order_by('-count')
-    
-    # Daily usage trend (last 30 days for line chart)
-    daily_usage = []
-    for i in range(29, -1, -1):
-        date = timezone.now().date() - timedelta(days=i)
-        date_start = timezone.make_aware(datetime.combine(date, datetime.min.time()))
-        date_end = timezone.make_aware(datetime.combine(date, datetime.max.time()))
-        count = AIUsageLog.objects.filter(
-            user=user,
-            timestamp__gte=date_start,
-            timestamp__lte=date_end
-        ).count()
-        daily_usage.append({
-            'date': date.strftime('%Y-%m-%d'),
-            'count': count
-        })
-    
+    # Chart data (pie/bar/line) only changes when the user logs new usage,
+    # so the serialized JSON is cached per user and invalidated by the
+    # post_save/post_delete signals on AIUsageLog
+    charts_key = chart_cache_key(user.id)
+    charts = cache.get(charts_key)
+    if charts is None:
+        # Usage by tool (pie chart data)
+        usage_by_tool = AIUsageLog.objects.filter(user=user).values('ai_tool').annotate(
+            count=Count('id')
+        ).order_by('-count')
+
+        # Usage by type (bar chart data)
+        usage_by_type = AIUsageLog.objects.filter(user=user).values('usage_type').annotate(
+            count=Count('id')
+        ).order_by('-count')
+
+        # Daily usage trend (last 30 days for line chart), one GROUP BY query
+        counts_by_day = dict(
+            AIUsageLog.objects.filter(user=user, timestamp__gte=month_start)
+            .annotate(day=TruncDate('timestamp'))
+            .values('day')
+            .annotate(count=Count('id'))
+            .values_list('day', 'count')
+        )
+        daily_usage = [
+            {
+                'date': (today - timedelta(days=i)).strftime('%Y-%m-%d'),
+                'count': counts_by_day.get(today - timedelta(days=i), 0),
+            }
+            for i in range(29, -1, -1)
+        ]
+        charts = {
+            'by_tool': _json_dumps(list(usage_by_tool)),
+            'by_type': _json_dumps(list(usage_by_type)),
+            'daily': _json_dumps(daily_usage),
+        }
+        cache.set(charts_key, charts, 300)
+
     context = {
         'total_usage': total_usage,
         'today_usage': today_usage,
@@ -208,9 +269,9 @@ def dashboard_view(request):
         'compliance_status': compliance_status,
         'recent_logs': recent_logs,
         'unread_insights': unread_insights,
-        'usage_by_tool': json.dumps(list(usage_by_tool)),
-        'usage_by_type': json.dumps(list(usage_by_type)),
-        'daily_usage': json.dumps(daily_usage),
+        'usage_by_tool': charts['by_tool'],
+        'usage_by_type': charts['by_type'],
+        'daily_usage': charts['daily'],
         'active_policy': active_policy,
     }
     
@@ -232,13 +293,8 @@ def log_usage_view(request):
             usage_log.user = request.user
             
             # Get active policy
-            active_policy = AIEthicsPolicy.objects.filter(
-                status='active',
-                effective_from__lte=timezone.now().date()
-            ).filter(
-                Q(effective_until__gte=timezone.now().date()) | Q(effective_until__isnull=True)
-            ).first()
-            
+            active_policy = _get_active_policy()
+
             if active_policy:
                 usage_log.policy = active_policy
             
@@ -266,7 +322,14 @@ def usage_history_view(request):
     """
     Display full usage history with filtering and pagination.
     """
-    usage_logs = AIUsageLog.objects.filter(user=request.user).order_by('-timestamp')
+    # Project only the columns the list template renders; the joined policy
+    # needs a field listed too so only() doesn't defer the relation
+    usage_logs = AIUsageLog.objects.filter(user=request.user).select_related(
+        'policy'
+    ).only(
+        'ai_tool', 'usage_type', 'description', 'course_code',
+        'duration_minutes', 'is_compliant', 'timestamp', 'policy__title'
+    ).order_by('-timestamp')
     
     # Filter by AI tool
     tool_filter = request.GET.get('tool')
@@ -278,25 +341,49 @@ def usage_history_view(request):
     if type_filter:
         usage_logs = usage_logs.filter(usage_type=type_filter)
     
-    # Filter by date range
+    # Filter by date range using half-open bounds: [date_from, date_to + 1)
+    # covers the whole final day without a 23:59:59.999999 upper edge and
+    # keeps the range a clean index scan
     date_from = request.GET.get('date_from')
     date_to = request.GET.get('date_to')
     if date_from:
-        usage_logs = usage_logs.filter(timestamp__gte=date_from)
+        from_date = parse_date(date_from)
+        if from_date is not None:
+            usage_logs = usage_logs.filter(
+                timestamp__gte=timezone.make_aware(
+                    datetime.combine(from_date, time.min)
+                )
+            )
     if date_to:
-        usage_logs = usage_logs.filter(timestamp__lte=date_to)
-    
-    # Pagination
-    paginator = Paginator(usage_logs, 25)  # Show 25 logs per page
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
-    
+        to_date = parse_date(date_to)
+        if to_date is not None:
+            usage_logs = usage_logs.filter(
+                timestamp__lt=timezone.make_aware(
+                    datetime.combine(to_date + timedelta(days=1), time.min)
+                )
+            )
+    
+    # Keyset pagination: each page seeks the (user, timestamp) index from
+    # the cursor instead of counting all rows and skipping an OFFSET, so
+    # deep pages cost the same as the first one. Fetching one extra row
+    # tells us whether a next page exists.
+    before = request.GET.get('before')
+    if before:
+        cursor = parse_datetime(before)
+        if cursor is not None:
+            usage_logs = usage_logs.filter(timestamp__lt=cursor)
+    usage_logs = list(usage_logs[:26])
+    has_next = len(usage_logs) == 26
+    usage_logs = usage_logs[:25]
+    next_cursor = usage_logs[-1].timestamp.isoformat() if has_next else None
+
     # Get filter choices
     ai_tools = AIUsageLog.AI_TOOL_CHOICES
     usage_types = AIUsageLog.USAGE_TYPE_CHOICES
-    
+
     context = {
-        'page_obj': page_obj,
+        'usage_logs': usage_logs,
+        'next_cursor': next_cursor,
         'ai_tools': ai_tools,
         'usage_types': usage_types,
         'current_filters': {
@@ -315,14 +402,20 @@ def insights_view(request):
     """
     Display personalized insights and recommendations.
     """
-    insights = UserInsight.objects.filter(
+    # Evaluate once: the template iterates the same rows the mark-as-read
+    # UPDATE touches, so rendering from this list avoids a second SELECT
+    insights = list(UserInsight.objects.filter(
         user=request.user,
         is_dismissed=False
-    ).order_by('-priority', '-generated_at')
-    
+    ).order_by('-priority', '-generated_at'))
+
     # Mark insights as read when viewed
-    unread_insights = insights.filter(is_read=False)
-    unread_insights.update(is_read=True)
+    unread_ids = [insight.id for insight in insights if not insight.is_read]
+    if unread_ids:
+        UserInsight.objects.filter(id__in=unread_ids).update(is_read=True)
+        for insight in insights:
+            if insight.id in unread_ids:
+                insight.is_read = True
     
     context = {
         'insights': insights,
@@ -403,49 +496,55 @@ def profile_view(request):
 def export_data_view(request):
     """
     Export user data (GDPR compliance).
-    
-    Allows users to download all their data in JSON format.
+
+    Streams the export as JSON so large usage histories never sit fully in
+    memory: each queryset is drained through .iterator() and serialized row
+    by row as the response body is written.
     """
-    import json
-    from django.http import HttpResponse
-    
     user = request.user
     profile = user.profile
-    
-    # Collect all user data
-    data = {
-        'user': {
-            'username': user.username,
-            'email': user.email,
-            'first_name': user.first_name,
-            'last_name': user.last_name,
-            'date_joined': user.date_joined.isoformat(),
-        },
-        'profile': {
-            'student_id': profile.student_id,
-            'department': profile.department,
-            'enrollment_date': profile.enrollment_date.isoformat(),
-            'data_collection_consent': profile.data_collection_consent,
-            'consent_date': profile.consent_date.isoformat() if profile.consent_date else None,
-        },
-        'usage_logs': list(AIUsageLog.objects.filter(user=user).values(
+
+    user_data = {
+        'username': user.username,
+        'email': user.email,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'date_joined': user.date_joined.isoformat(),
+    }
+    profile_data = {
+        'student_id': profile.student_id,
+        'department': profile.department,
+        'enrollment_date': profile.enrollment_date.isoformat(),
+        'data_collection_consent': profile.data_collection_consent,
+        'consent_date': profile.consent_date.isoformat() if profile.consent_date else None,
+    }
+    row_sections = (
+        ('usage_logs', AIUsageLog.objects.filter(user=user).values(
             'ai_tool', 'usage_type', 'description', 'course_code',
             'duration_minutes', 'tokens_used', 'is_compliant', 'timestamp'
         )),
-        'insights': list(UserInsight.objects.filter(user=user).values(
+        ('insights', UserInsight.objects.filter(user=user).values(
             'insight_type', 'title', 'message', 'priority', 'generated_at'
         )),
-        'feedback': list(UserFeedback.objects.filter(user=user).values(
+        ('feedback', UserFeedback.objects.filter(user=user).values(
             'feedback_type', 'title', 'description', 'status', 'submitted_at'
         )),
-    }
-    
-    # Convert to JSON
-    json_data = json.dumps(data, indent=2, default=str)
-    
-    # Create response
-    response = HttpResponse(json_data, content_type='application/json')
+    )
+
+    def stream():
+        yield '{\n"user": ' + _json_dumps(user_data)
+        yield ',\n"profile": ' + _json_dumps(profile_data)
+        for key, queryset in row_sections:
+            yield f',\n"{key}": ['
+            first = True
+            for row in queryset.iterator(chunk_size=2000):
+                yield ('' if first else ',') + _json_dumps(row)
+                first = False
+            yield ']'
+        yield '\n}'
+
+    response = StreamingHttpResponse(stream(), content_type='application/json')
     response['Content-Disposition'] = f'attachment; filename="ai_usage_data_{user.username}.json"'
-    
+
     messages.success(request, 'Your data has been exported.')
     return response